@@ -0,0 +1,117 @@
+"""
+Authentication classes for the auth_api application.
+
+This module customizes the JWT authentication provided by
+`rest_framework_simplejwt` for the To-Do List application. Every request made
+with an access token has to decode the token and verify its signature; the
+classes here keep recently validated tokens around so repeated requests with
+the same token skip that work.
+"""
+import hashlib
+import threading
+import time
+
+from cachetools import TTLCache
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication that caches validated tokens for a short time.
+
+    Validated tokens are stored in a process-local TTL cache keyed by a digest of
+    the raw token, so the signature is only verified once per token every few
+    seconds. A cached token whose `exp` claim has passed is evicted and validated
+    again, so caching never extends a token's lifetime. Tokens that fail
+    validation are never cached.
+
+    The authenticated user is loaded with only the columns requests commonly read,
+    instead of the whole row; any other field is fetched on first access.
+
+    Attributes:
+        token_cache_ttl (int): Number of seconds a validated token stays cached.
+        token_cache_size (int): Maximum number of tokens kept in the cache. Together
+            with `token_cache_ttl`, it is read when the class first builds its cache,
+            so subclasses can override both.
+        user_fields (tuple): User columns loaded for the authenticated user. They
+            cover the permission checks, throttling, and djoser's `users/me/`.
+    """
+    token_cache_ttl = 10
+    token_cache_size = 10_000
+    user_fields = ('id', 'username', 'email', 'is_active', 'is_staff', 'is_superuser')
+
+    _lock = threading.Lock()
+
+    @classmethod
+    def _token_cache(cls):
+        """
+        Return the class's cache of validated tokens, building it on first use.
+
+        Must be called with `_lock` held. Every subclass gets its own cache, sized
+        from its own settings.
+        """
+        cache = cls.__dict__.get('_validated_tokens')
+        if cache is None:
+            cache = TTLCache(maxsize=cls.token_cache_size, ttl=cls.token_cache_ttl)
+            cls._validated_tokens = cache
+        return cache
+
+    def get_validated_token(self, raw_token):
+        """
+        Return the validated token for `raw_token`, reusing a cached one if available.
+        """
+        key = hashlib.blake2b(raw_token, digest_size=16).digest()
+        with self._lock:
+            validated_tokens = self._token_cache()
+            validated_token = validated_tokens.get(key)
+            if validated_token is not None and validated_token['exp'] <= time.time():
+                # Expired since it was cached; let the full validation reject it
+                del validated_tokens[key]
+                validated_token = None
+
+        if validated_token is None:
+            validated_token = super().get_validated_token(raw_token)
+            with self._lock:
+                self._token_cache()[key] = validated_token
+
+        return validated_token
+
+    def get_user(self, validated_token):
+        """
+        Return the user identified by `validated_token`, loading only `user_fields`.
+
+        Behaves like `JWTAuthentication.get_user`, rejecting tokens of unknown or
+        inactive users.
+        """
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as exc:
+            raise InvalidToken(_('Token contained no recognizable user identification')) from exc
+
+        fields = self.user_fields
+        if api_settings.CHECK_REVOKE_TOKEN:
+            # The revocation check compares against the stored password hash
+            fields += ('password',)
+
+        try:
+            user = self.user_model.objects.only(*fields).get(
+                **{api_settings.USER_ID_FIELD: user_id}
+            )
+        except self.user_model.DoesNotExist as exc:
+            raise AuthenticationFailed(_('User not found'), code='user_not_found') from exc
+
+        if not user.is_active:
+            raise AuthenticationFailed(_('User is inactive'), code='user_inactive')
+
+        if api_settings.CHECK_REVOKE_TOKEN and validated_token.get(
+            api_settings.REVOKE_TOKEN_CLAIM
+        ) != get_md5_hash_password(user.password):
+            raise AuthenticationFailed(
+                _("The user's password has been changed."), code='password_changed'
+            )
+
+        return user
@@ -30,4 +30,4 @@ class CustomUser(AbstractUser):
     last_name = models.TextField(blank=True, null=True)
 
     def __str__(self):
-        return f'{self.username}'
+        return self.username
@@ -7,9 +7,16 @@ Django Rest Framework (DRF) serializers to handle various models within the
 application, ensuring proper validation, serialization, and deserialization 
 of data.
 """
+import hashlib
+import threading
+
+from cachetools import TTLCache
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
+from django.contrib.auth.models import update_last_login
 from djoser.serializers import UserCreateSerializer
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from rest_framework_simplejwt.settings import api_settings
 
 User = get_user_model()
 
@@ -30,3 +37,80 @@ class CustomUserCreateSerializer(UserCreateSerializer):
     class Meta(UserCreateSerializer.Meta):
         model = User
         fields = UserCreateSerializer.Meta.fields  + ('first_name', 'last_name')
+
+
+class CachedTokenObtainPairSerializer(TokenObtainPairSerializer):  # pylint: disable=W0223
+    """
+    Token obtain serializer that skips password hashing for recently verified logins.
+
+    Verifying a password runs the configured password hasher, which is deliberately
+    slow. After a successful login, a digest of the user's id, stored password hash
+    and submitted password is remembered for a short time; a repeated login with the
+    same credentials within that window is accepted without hashing the password again.
+
+    Because the stored password hash is part of the digest, changing the password
+    invalidates the cached entry immediately. Inactive users are still rejected.
+
+    Enabled through `SIMPLE_JWT['TOKEN_OBTAIN_SERIALIZER']`.
+
+    Attributes:
+        credentials_cache_ttl (int): Number of seconds a verified login is remembered.
+        credentials_cache_size (int): Maximum number of verified logins kept in the cache.
+            Together with `credentials_cache_ttl`, it is read when the class first builds
+            its cache, so subclasses can override both.
+    """
+    credentials_cache_ttl = 30
+    credentials_cache_size = 1000
+
+    _lock = threading.Lock()
+
+    @classmethod
+    def _credentials_cache(cls):
+        """
+        Return the class's cache of verified logins, building it on first use.
+
+        Must be called with `_lock` held. Every subclass gets its own cache, sized
+        from its own settings.
+        """
+        cache = cls.__dict__.get('_verified_credentials')
+        if cache is None:
+            cache = TTLCache(maxsize=cls.credentials_cache_size, ttl=cls.credentials_cache_ttl)
+            cls._verified_credentials = cache
+        return cache
+
+    def validate(self, attrs):
+        """
+        Issue a token pair, authenticating the credentials only if they were not
+        verified recently.
+        """
+        password = attrs['password']
+        try:
+            user = User.objects.get_by_natural_key(attrs[self.username_field])
+        except User.DoesNotExist:
+            user = None
+
+        if user is not None and api_settings.USER_AUTHENTICATION_RULE(user):
+            with self._lock:
+                verified = self._credentials_key(user, password) in self._credentials_cache()
+            if verified:
+                # Same as TokenObtainPairSerializer.validate, minus the authenticate() call
+                self.user = user  # pylint: disable=W0201
+                refresh = self.get_token(user)
+                data = {'refresh': str(refresh), 'access': str(refresh.access_token)}
+                if api_settings.UPDATE_LAST_LOGIN:
+                    update_last_login(None, user)
+                return data
+
+        data = super().validate(attrs)
+        # authenticate() may have upgraded the stored hash, so key on the fresh user
+        with self._lock:
+            self._credentials_cache()[self._credentials_key(self.user, password)] = True
+        return data
+
+    @staticmethod
+    def _credentials_key(user, password):
+        """
+        Return the cache key for a user and a submitted password.
+        """
+        credentials = f'{user.pk}|{user.password}|{password}'.encode()
+        return hashlib.blake2b(credentials, digest_size=16).digest()
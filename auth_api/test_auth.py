@@ -22,20 +22,23 @@ Note:
 - The APIClient from Django REST Framework is used to 
   simulate HTTP requests to the authentication endpoints.
 """
+import hashlib
+from datetime import timedelta
+from unittest import mock
+
 import pytest
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import get_hasher
 from rest_framework import status
-from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+from .authentication import CachedJWTAuthentication
+from .serializers import CachedTokenObtainPairSerializer
 
 User = get_user_model()
 
-@pytest.fixture
-def api_client():
-    """Returns an instance of APIClient for making API requests in tests."""
-    return APIClient()
-
+# Every test runs inside a transaction that is rolled back afterwards
+pytestmark = pytest.mark.django_db
 
-@pytest.mark.django_db
 def test_create_user_with_required_fields(api_client):
     """Test creating a user with all required fields using Djoser API."""
     url = '/auth/users/'
@@ -55,7 +58,6 @@ def test_create_user_with_required_fields(api_client):
     assert user.check_password('password123!@#')
 
 
-@pytest.mark.django_db
 def test_first_name_required(api_client):
     """Test that first_name is required for user creation using Djoser API."""
     url = '/auth/users/'
@@ -70,7 +72,6 @@ def test_first_name_required(api_client):
     assert 'first_name' in response.data
 
 
-@pytest.mark.django_db
 def test_last_name_optional(api_client):
     """Test that last_name is optional and defaults to an empty string using Djoser API."""
     url = '/auth/users/'
@@ -85,11 +86,10 @@ def test_last_name_optional(api_client):
     assert response.status_code == status.HTTP_201_CREATED
 
     # Verifying the user has been created with an empty last_name
-    user = User.objects.get(username='testuser')
+    user = User.objects.only('last_name', 'email').get(pk=response.data['id'])
     assert user.last_name in ['', None]
     assert user.email == 'testuser@example.com'
 
-@pytest.mark.django_db
 def test_last_name_is_text_field(api_client):
     """Test that last_name can handle a long string, which is typical for a TextField."""
     url = '/auth/users/'
@@ -106,11 +106,10 @@ def test_last_name_is_text_field(api_client):
     assert response.status_code == status.HTTP_201_CREATED
 
     # Fetch the user from the database and verify last_name is stored correctly
-    user = User.objects.get(username='testuser')
+    user = User.objects.only('last_name').get(pk=response.data['id'])
     assert user.last_name == long_last_name, "The last_name field should store long text."
 
 
-@pytest.mark.django_db
 def test_username_required(api_client):
     """Test that username is required for user creation using Djoser API."""
     url = '/auth/users/'
@@ -124,11 +123,11 @@ def test_username_required(api_client):
     assert 'username' in response.data  # Check that the response contains a 'username' error
 
 
-@pytest.mark.django_db
 def test_username_unique(api_client):
     """Test that the username must be unique using Djoser API."""
-    # First, create a user with the username 'testuser'
-    User.objects.create_user(username='testuser', first_name='John', password='password123')
+    # First, create a user with the username 'testuser'. Its password is never checked,
+    # so store an unusable one instead of hashing it.
+    User.objects.create(username='testuser', first_name='John', password='!unusable')
 
     # Attempt to create another user with the same username
     url = '/auth/users/'
@@ -144,7 +143,6 @@ def test_username_unique(api_client):
     assert 'username' in response.data  # Check that the response contains a 'username' error
 
 
-@pytest.mark.django_db
 def test_password_min_length(api_client):
     """Test that the password must meet the minimum length requirement using Djoser API."""
     url = '/auth/users/'
@@ -158,7 +156,6 @@ def test_password_min_length(api_client):
     assert response.status_code == status.HTTP_400_BAD_REQUEST
     assert 'password' in response.data
 
-@pytest.mark.django_db
 def test_jwt_authentication(api_client):
     """Test JWT token creation with valid credentials."""
     url = '/auth/users/'
@@ -183,7 +180,6 @@ def test_jwt_authentication(api_client):
     assert 'refresh' in response.data
 
 
-@pytest.mark.django_db
 def test_invalid_jwt_authentication(api_client):
     """Test that invalid credentials do not authenticate the user."""
     response = api_client.post(
@@ -194,7 +190,64 @@ def test_invalid_jwt_authentication(api_client):
     assert 'access' not in response.data
 
 
-@pytest.mark.django_db
+def test_repeated_jwt_login_after_password_change(api_client):
+    """Test that a recently verified login is not reused once the password has changed."""
+    user = User.objects.create_user(
+        username='testuser',
+        first_name='John',
+        password='password123!@#'
+    )
+    login_data = {'username': 'testuser', 'password': 'password123!@#'}
+    hasher_class = type(get_hasher())
+
+    # Log in twice with the same credentials, the second time from the verified login cache
+    with mock.patch.object(
+        hasher_class, 'verify', autospec=True, side_effect=hasher_class.verify
+    ) as verify:
+        response = api_client.post('/auth/jwt/create/', login_data)
+        assert response.status_code == status.HTTP_200_OK
+        response = api_client.post('/auth/jwt/create/', login_data)
+        assert response.status_code == status.HTTP_200_OK
+        assert 'access' in response.data
+
+    # Only the first login hashed the password
+    assert verify.call_count == 1
+
+    user.set_password('newpassword123!@#')
+    user.save()
+
+    # The old password must be rejected even though it was verified moments ago
+    response = api_client.post('/auth/jwt/create/', login_data)
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    response = api_client.post(
+        '/auth/jwt/create/',
+        {'username': 'testuser', 'password': 'newpassword123!@#'}
+    )
+    assert response.status_code == status.HTTP_200_OK
+
+
+def test_repeated_jwt_login_after_deactivation(api_client):
+    """Test that a recently verified login is not reused once the user is deactivated."""
+    user = User.objects.create_user(
+        username='testuser',
+        first_name='John',
+        password='password123!@#'
+    )
+    login_data = {'username': 'testuser', 'password': 'password123!@#'}
+
+    response = api_client.post('/auth/jwt/create/', login_data)
+    assert response.status_code == status.HTTP_200_OK
+
+    user.is_active = False
+    user.save()
+
+    # The credentials are still cached, but inactive users must be rejected
+    response = api_client.post('/auth/jwt/create/', login_data)
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    assert 'access' not in response.data
+
+
 def test_refresh_jwt_token(api_client):
     """Test refreshing the JWT token with a valid refresh token."""
     url = '/auth/users/'
@@ -222,27 +275,9 @@ def test_refresh_jwt_token(api_client):
     assert 'access' in refresh_response.data
 
 
-@pytest.mark.django_db
-def test_access_protected_view_with_jwt(api_client):
+def test_access_protected_view_with_jwt(api_client, authed_user):
     """Test accessing a protected view using a valid JWT token."""
-    # Create a user and get tokens
-    url = '/auth/users/'
-    data = {
-        'username': 'testuser',
-        'first_name': 'John',
-        'last_name' : 'Dillinger',
-        'password': 'password123!@#',
-        'email': 'testuser@example.com'
-    }
-
-    registration_response = api_client.post(url, data, format='json')
-    assert registration_response.status_code == status.HTTP_201_CREATED
-
-    login_data = {'username': 'testuser', 'password': 'password123!@#'}
-    login_response = api_client.post('/auth/jwt/create/', login_data, format='json')
-
-    access_token = login_response.data['access']
-    assert access_token is not None, "No access token returned"
+    user, access_token = authed_user
 
     # Set the Authorization header with the token
     api_client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
@@ -250,9 +285,8 @@ def test_access_protected_view_with_jwt(api_client):
     # Access a protected view (e.g., user details)
     response = api_client.get('/auth/users/me/')
     assert response.status_code == status.HTTP_200_OK
-    assert response.data['username'] == 'testuser'
+    assert response.data['username'] == user.username
 
-@pytest.mark.django_db
 def test_access_protected_view_with_invalid_jwt(api_client):
     """Test accessing a protected view using an invalid JWT token."""
     # Use an invalid JWT token
@@ -264,3 +298,74 @@ def test_access_protected_view_with_invalid_jwt(api_client):
 
     # Assert that the response status is HTTP 401 Unauthorized
     assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+def test_validated_jwt_is_cached(authed_user):
+    """Test that a JWT is only validated once and reused on subsequent requests."""
+    _, access_token = authed_user
+    raw_token = access_token.encode()
+
+    authentication = CachedJWTAuthentication()
+    validated_token = authentication.get_validated_token(raw_token)
+
+    # The second lookup must return the cached token instead of decoding it again
+    assert authentication.get_validated_token(raw_token) is validated_token
+
+
+def test_expired_cached_jwt_is_rejected(api_client, authed_user):
+    """Test that a cached JWT is rejected once its `exp` claim has passed."""
+    user, _ = authed_user
+    token = AccessToken.for_user(user)
+    token.set_exp(lifetime=-timedelta(seconds=1))
+    raw_token = str(token).encode()
+
+    # Simulate a token that was validated and cached shortly before it expired
+    key = hashlib.blake2b(raw_token, digest_size=16).digest()
+    with CachedJWTAuthentication._lock:  # pylint: disable=W0212
+        CachedJWTAuthentication._token_cache()[key] = token  # pylint: disable=W0212
+
+    api_client.credentials(HTTP_AUTHORIZATION=f'Bearer {raw_token.decode()}')
+    response = api_client.get('/auth/users/me/')
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    assert key not in CachedJWTAuthentication._token_cache()  # pylint: disable=W0212
+
+
+def test_jwt_user_is_loaded_with_needed_fields_only(api_client, authed_user,
+                                                    django_assert_num_queries):
+    """Test that the JWT-authenticated user is fetched with one narrow query."""
+    user, access_token = authed_user
+    api_client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+
+    # Loading the user is the only query; rendering `users/me/` needs no deferred field
+    with django_assert_num_queries(1) as captured:
+        response = api_client.get('/auth/users/me/')
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data == {'id': user.pk, 'username': user.username, 'email': user.email}
+    assert 'first_name' not in captured.captured_queries[0]['sql']
+
+
+def test_token_cache_settings_can_be_overridden():
+    """Test that a subclass's cache settings size the cache it uses."""
+    class ShortLivedJWTAuthentication(CachedJWTAuthentication):
+        """Authentication that remembers a single token for one second."""
+        token_cache_ttl = 1
+        token_cache_size = 1
+
+    # pylint: disable=W0212
+    token_cache = ShortLivedJWTAuthentication._token_cache()
+    assert (token_cache.maxsize, token_cache.ttl) == (1, 1)
+    assert CachedJWTAuthentication._token_cache() is not token_cache
+
+
+def test_credentials_cache_settings_can_be_overridden():
+    """Test that a subclass's login cache settings size the cache it uses."""
+    class ShortLivedTokenObtainPairSerializer(CachedTokenObtainPairSerializer):  # pylint: disable=W0223
+        """Serializer that remembers a single login for one second."""
+        credentials_cache_ttl = 1
+        credentials_cache_size = 1
+
+    # pylint: disable=W0212
+    credentials_cache = ShortLivedTokenObtainPairSerializer._credentials_cache()
+    assert (credentials_cache.maxsize, credentials_cache.ttl) == (1, 1)
+    assert CachedTokenObtainPairSerializer._credentials_cache() is not credentials_cache
@@ -0,0 +1,149 @@
+# pylint: disable=W0613,W0621
+"""
+Shared pytest fixtures for the To-Do List application tests.
+
+Fixtures defined here are available to the test modules of every application.
+Session-scoped fixtures that touch the database create their rows outside of the
+per-test transactions, so those rows survive each test's rollback and are only
+created once per test run. All shared users are created directly through the
+ORM, skipping registration requests. `users` and its per-user fixtures cover most
+tests, which authenticate with minted tokens (`login_as`) or `force_authenticate`;
+only `authed_user` also logs in through the JWT endpoint, for the auth tests that
+need a token issued by a real login.
+"""
+import pytest
+from django.contrib.auth import get_user_model
+from rest_framework import status
+from rest_framework.test import APIClient, APIRequestFactory
+from rest_framework_simplejwt.tokens import AccessToken
+
+
+@pytest.fixture(scope='session')
+def api_client():
+    """
+    Returns an instance of APIClient for making API requests in tests.
+
+    A single client is shared by the whole test session; `reset_api_client` clears
+    its credentials after every test.
+    """
+    return APIClient()
+
+
+@pytest.fixture(scope='session')
+def api_factory():
+    """
+    Returns an instance of APIRequestFactory for building requests in tests.
+
+    Requests built with the factory are passed straight to a view, skipping URL
+    routing and the middleware stack; authenticate them with `force_authenticate`.
+    """
+    return APIRequestFactory()
+
+
+@pytest.fixture(autouse=True)
+def reset_api_client(api_client):
+    """Clears the shared APIClient's credentials and session after each test."""
+    yield
+    api_client.credentials()
+    api_client.logout()
+
+
+@pytest.fixture(scope='session')
+def authed_user(django_db_setup, django_db_blocker):
+    """
+    Returns a `(user, access_token)` tuple for a user shared by the whole test session.
+
+    The user is created through the ORM with a usable password and logged in through
+    `/auth/jwt/create/` once, instead of every test paying for its own login.
+    """
+    username = 'authuser'
+    password = 'password123!@#'
+
+    with django_db_blocker.unblock():
+        user = get_user_model().objects.create_user(
+            username=username,
+            first_name='Auth',
+            password=password,
+            email='authuser@example.com'
+        )
+
+        login_data = {'username': username, 'password': password}
+        login_response = APIClient().post('/auth/jwt/create/', login_data, format='json')
+
+    assert (login_response.status_code == status.HTTP_200_OK
+    ), f"Login of the shared user failed: {login_response.data}"
+    return user, login_response.data['access']
+
+
+@pytest.fixture(scope='session')
+def users(django_db_setup, django_db_blocker):
+    """
+    Returns the users shared by the whole test session, keyed by username.
+
+    All of them are inserted with a single bulk INSERT and fetched back with one
+    query. None of them has a usable password; tests authenticate them with minted
+    tokens or `force_authenticate`.
+    """
+    user_model = get_user_model()
+    new_users = [
+        user_model(
+            username='user1',
+            first_name='John',
+            last_name='Doe',
+            email='user1@example.com'
+        ),
+        user_model(
+            username='user2',
+            first_name='Jane',
+            last_name='Smith',
+            email='user2@example.com'
+        ),
+        user_model(
+            username='admin',
+            email='admin@example.com',
+            is_staff=True,
+            is_superuser=True
+        ),
+    ]
+    for user in new_users:
+        user.set_unusable_password()
+
+    with django_db_blocker.unblock():
+        user_model.objects.bulk_create(new_users, ignore_conflicts=True)
+        # Primary keys aren't set on rows inserted with ignore_conflicts, so read them back
+        return user_model.objects.in_bulk(
+            [user.username for user in new_users],
+            field_name='username'
+        )
+
+
+@pytest.fixture(scope='session')
+def user1(users):
+    """Returns a regular user shared by the whole test session."""
+    return users['user1']
+
+
+@pytest.fixture(scope='session')
+def user2(users):
+    """Returns a second regular user shared by the whole test session."""
+    return users['user2']
+
+
+@pytest.fixture(scope='session')
+def admin(users):
+    """Returns an admin user shared by the whole test session."""
+    return users['admin']
+
+
+@pytest.fixture
+def login_as(api_client):
+    """
+    Returns a function that authenticates the shared APIClient as a given user.
+
+    The client sends a JWT access token minted for the user, so no login request is
+    made; `reset_api_client` clears the credentials after the test.
+    """
+    def _login_as(user):
+        api_client.credentials(HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(user)}')
+        return api_client
+    return _login_as
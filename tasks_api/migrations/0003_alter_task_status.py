@@ -0,0 +1,40 @@
+# Generated by Django 5.1.1 on 2026-10-15 21:58
+
+from django.db import migrations, models
+
+# Integer value stored for each of the previous string statuses
+STATUS_VALUES = {
+    'New': 0,
+    'In Progress': 1,
+    'Completed': 2,
+}
+
+
+def statuses_to_integers(apps, schema_editor):
+    """Rewrite string statuses as integers so the column can be cast to smallint."""
+    Task = apps.get_model('tasks_api', 'Task')
+    for label, value in STATUS_VALUES.items():
+        Task.objects.filter(status=label).update(status=str(value))
+
+
+def statuses_to_labels(apps, schema_editor):
+    """Restore the string statuses after the column has been cast back to varchar."""
+    Task = apps.get_model('tasks_api', 'Task')
+    for label, value in STATUS_VALUES.items():
+        Task.objects.filter(status=str(value)).update(status=label)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks_api', '0002_alter_task_status'),
+    ]
+
+    operations = [
+        migrations.RunPython(statuses_to_integers, statuses_to_labels),
+        migrations.AlterField(
+            model_name='task',
+            name='status',
+            field=models.PositiveSmallIntegerField(choices=[(0, 'New'), (1, 'In Progress'), (2, 'Completed')], db_index=True, default=0),
+        ),
+    ]
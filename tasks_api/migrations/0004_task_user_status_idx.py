@@ -0,0 +1,24 @@
+# Generated by Django 5.1.1 on 2026-10-15 22:00
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks_api', '0003_alter_task_status'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='task',
+            name='status',
+            field=models.PositiveSmallIntegerField(choices=[(0, 'New'), (1, 'In Progress'), (2, 'Completed')], default=0),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['user', 'status'], name='task_user_status_idx'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.1.1 on 2026-10-15 22:13
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks_api', '0004_task_user_status_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['user', 'title'], name='task_user_title_idx'),
+        ),
+    ]
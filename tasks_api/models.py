@@ -23,23 +23,55 @@ class Task(models.Model):
     Attributes:
         title (CharField): The title of the task, required, maximum length of 255 characters.
         description (TextField): A detailed description of the task, optional and can be left blank.
-        status (CharField): The current status of the task, chosen from predefined options 
-            ('New', 'In Progress', 'Completed'). Defaults to 'New'.
+        status (PositiveSmallIntegerField): The current status of the task, chosen from
+            `Task.Status` ('New', 'In Progress', 'Completed') and stored as a small integer.
+            Defaults to 'New'.
         user (ForeignKey): The user who is assigned to the task, linked to the custom user model.
 
+    Meta:
+        indexes: Composite indexes on (user, status) for filtering a user's tasks by status
+            and on (user, title) for listing a user's tasks in title order.
+
     Methods:
         __str__(): Returns the string representation of the task, which is its title.
     """
-    STATUS_CHOICES = [
-        ('New', 'New'),
-        ('In Progress', 'In Progress'),
-        ('Completed', 'Completed'),
-    ]
+    class Status(models.IntegerChoices):  # pylint: disable=R0901
+        """
+        Possible states of a task.
+
+        Stored as small integers to keep the column and its index compact; the API
+        exposes the labels.
+        """
+        NEW = 0, 'New'
+        IN_PROGRESS = 1, 'In Progress'
+        COMPLETED = 2, 'Completed'
+
+        @classmethod
+        def from_label(cls, label):
+            """
+            Return the status whose label is `label`, raising ValueError if there is none.
+            """
+            for status in cls:
+                if status.label == label:
+                    return status
+            raise ValueError(f'{label!r} is not a valid task status')
 
     title = models.CharField(max_length=255, null=False, blank=False)
     description = models.TextField(null=True, blank=True)
-    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='New', db_index=True)
-    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
+    status = models.PositiveSmallIntegerField(
+        choices=Status.choices,
+        default=Status.NEW
+    )
+    # Both composite indexes below lead with user, so the FK needs no index of its own
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, db_index=False)
+
+    class Meta:
+        indexes = [
+            # Serves the "my tasks with status X" lookup behind ?status= filtering
+            models.Index(fields=['user', 'status'], name='task_user_status_idx'),
+            # Lets the per-user task list be read in title order without a sort step
+            models.Index(fields=['user', 'title'], name='task_user_title_idx'),
+        ]
 
     def __str__(self):
-        return f'{self.title}'
+        return self.title
@@ -0,0 +1,26 @@
+"""
+Pagination for the tasks application.
+
+This module defines how task listings are split into pages. Tasks are paginated
+with a cursor rather than page numbers, so fetching a page neither counts the
+whole table nor skips over the rows of the preceding pages.
+"""
+from rest_framework.pagination import CursorPagination
+
+class TaskCursorPagination(CursorPagination):
+    """
+    Cursor pagination for task listings, in title order.
+
+    Responses contain `next` and `previous` links carrying an opaque cursor, and
+    the tasks of the page under `results`. The page size defaults to the
+    `PAGE_SIZE` setting and can be changed with the `page_size` query parameter.
+
+    Attributes:
+        ordering (tuple): Tasks are ordered by title; the id breaks ties between
+            tasks with the same title so every page is stable.
+        page_size_query_param (str): Query parameter for choosing the page size.
+        max_page_size (int): Largest page size a client may request.
+    """
+    ordering = ('title', 'id')
+    page_size_query_param = 'page_size'
+    max_page_size = 100
@@ -0,0 +1,51 @@
+"""
+Parsers for the application's API.
+
+This module defines the parsers used to turn request bodies into Python data.
+It provides a JSON parser backed by `orjson`, the counterpart of the renderer
+in `renderers.py`, which decodes request bodies considerably faster than the
+standard library `json` module used by Django Rest Framework's default parser.
+"""
+import io
+import re
+
+import orjson
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+
+from .renderers import ORJSONRenderer
+
+# Integers orjson decodes exactly lie in [-2**63, 2**64 - 1]; anything beyond has at
+# least 20 digits, or 19 digits after a minus sign (-2**63 itself has 19)
+_WIDE_INTEGER = re.compile(rb'-\d{19}|\d{20}')
+
+class ORJSONParser(JSONParser):  # pylint: disable=R0903
+    """
+    Parser which deserializes JSON using `orjson`.
+
+    orjson only decodes UTF-8, so requests declaring any other charset are handed
+    to the default parser. orjson also turns integers outside the 64-bit range into
+    floats, losing precision, so bodies containing a run of 20 or more digits, or of
+    19 digits after a minus sign, are handed to the default parser too, which keeps
+    such integers exact. Like the default parser in strict mode, it rejects the
+    non-standard `NaN` and `Infinity` constants.
+    """
+    renderer_class = ORJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        """
+        Parses the incoming bytestream as JSON and returns the resulting data.
+        """
+        encoding = (parser_context or {}).get('encoding', settings.DEFAULT_CHARSET)
+        if encoding.lower().replace('_', '-') not in ('utf-8', 'utf8'):
+            return super().parse(stream, media_type, parser_context)
+
+        body = stream.read()
+        if _WIDE_INTEGER.search(body):
+            return super().parse(io.BytesIO(body), media_type, parser_context)
+
+        try:
+            return orjson.loads(body)
+        except orjson.JSONDecodeError as exc:
+            raise ParseError(f'JSON parse error - {exc}') from exc
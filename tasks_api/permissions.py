@@ -18,5 +18,6 @@ class IsOwnerOrReadOnly(permissions.BasePermission):
         if request.method in permissions.SAFE_METHODS:
             return True
 
-        # Write permissions are only allowed to the owner of the task
-        return obj.user == request.user
+        # Write permissions are only allowed to the owner of the task.
+        # Compare the raw foreign key so the check doesn't load the owner row.
+        return obj.user_id == request.user.pk
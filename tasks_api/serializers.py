@@ -10,28 +10,47 @@ of data.
 from rest_framework import serializers
 from .models import Task
 
+class TaskStatusField(serializers.ChoiceField):
+    """
+    Serializer field for `Task.status`.
+
+    Statuses are stored as integers, but the API keeps reading and writing their
+    labels ('New', 'In Progress', 'Completed').
+    """
+    def __init__(self, **kwargs):
+        super().__init__(choices=Task.Status.labels, **kwargs)
+
+    def to_internal_value(self, data):
+        return Task.Status.from_label(super().to_internal_value(data))
+
+    def to_representation(self, value):
+        return Task.Status(value).label
+
+
 class TasksSerializer(serializers.ModelSerializer):
     """
     Serializer for the Task model.
 
     This serializer handles the conversion of Task model instances to and from
-    JSON representations. It includes all fields from the Task model and ensures that
-    the 'user' field is read-only.
+    JSON representations. It lists the Task model fields explicitly and ensures that
+    the 'user' field is read-only. The 'status' field is exposed by its label.
 
     Methods:
         create(validated_data): Overrides the create method to automatically assign the
         task to the currently authenticated user.
     """
+    status = TaskStatusField(required=False)
+    # Rendered from the task's user_id column, never loading the user itself
+    user = serializers.PrimaryKeyRelatedField(read_only=True)
+
     class Meta:
         model = Task
-        fields = '__all__'
-        read_only_fields = ['user']
+        fields = ('id', 'title', 'description', 'status', 'user')
 
     def create(self, validated_data):
         """
         Override the create method to assign the task to the authenticated user.
         """
-        print(validated_data)
         # Assign the user from the request context to the new task
         user = self.context['request'].user
         task = Task.objects.create(user=user, **validated_data)
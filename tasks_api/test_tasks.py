@@ -11,42 +11,100 @@ Note:
 - Pytest is used for running the tests.
 - The APIClient from Django REST Framework is used to simulate HTTP requests 
   to the tasks API.
+- Tests that only exercise the list/create logic build their requests with
+  APIRequestFactory and call the viewset directly, skipping the middleware.
+- Users come from the session-scoped fixtures in the root `conftest.py`, and
+  `login_as` authenticates the APIClient as one of them with a minted JWT.
 """
+import io
+from datetime import datetime, timezone
+from urllib.parse import parse_qs, urlsplit
+
 import pytest
-from django.contrib.auth import get_user_model
 from rest_framework import status
-from rest_framework.test import APIClient
-
-
-User = get_user_model()
+from rest_framework.decorators import action
+from rest_framework.parsers import JSONParser
+from rest_framework.permissions import AllowAny
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+from rest_framework.test import force_authenticate
+from .models import Task
+from .parsers import ORJSONParser
+from .renderers import ORJSONRenderer
+from .views import TasksViewSet
+
+
+# The list/create view of the viewset, called directly by the unit-level tests
+task_list_view = TasksViewSet.as_view({'get': 'list', 'post': 'create'})
+
+
+# Request payloads shared by the tests; derive a new dict instead of mutating them
+NEW_USER = {
+    'username': 'testuser',
+    'first_name': 'John',
+    'last_name' : 'Dillinger',
+    'password': 'password123!@#',
+    'email': 'testuser@example.com',
+}
+TASK_NEW = {
+    'title': 'Test Task',
+    'description': 'This is a test task',
+    'status': 'New'
+}
+USER1_TASK = {
+    'title': 'User1 Task',
+    'description': 'Task created by user1',
+    'status': 'New'
+}
+TASK_UPDATED = {
+    'title': 'Updated Task',
+    'description': 'This is an updated test task',
+    'status': 'In Progress'
+}
+TASK_COMPLETED = {
+    'status': 'Completed'
+}
+
+
+# Every test runs inside a transaction that is rolled back afterwards
+pytestmark = pytest.mark.django_db
+
+
+def assert_task_matches(response, status_code, **expected):
+    """
+    Assert that `response` has `status_code` and that its task has the `expected` field values.
 
-@pytest.fixture
-def api_client():
-    """Returns an instance of APIClient for making API requests in tests."""
-    return APIClient()
+    The fields are compared as a single dict, so a failure shows every mismatching field.
+    """
+    assert (response.status_code == status_code
+    ), f"Expected status {status_code}, got {response.status_code}: {response.data}"
+    assert {field: response.data[field] for field in expected} == expected, "Task mismatch"
 
 
-@pytest.mark.django_db
-def test_create_task(api_client):
+def test_create_task(api_client, login_as, user1):
     """
     Test creating a task using a valid JWT token.
     """
-    # Create a user and get tokens
-    url = '/auth/users/'
-    data = {
-        'username': 'testuser',
-        'first_name': 'John',
-        'last_name' : 'Dillinger',
-        'password': 'password123!@#',
-        'email': 'testuser@example.com',
-    }
+    # Authenticate as user1
+    login_as(user1)
+
+    # Create a task
+    task_create_response = api_client.post('/api/tasks/', TASK_NEW, format='json')
+    assert_task_matches(task_create_response, status.HTTP_201_CREATED, **TASK_NEW)
 
-    registration_response = api_client.post(url, data, format='json')
+
+def test_registration_and_jwt_flow(api_client):
+    """
+    Test that a newly registered user can log in and manage tasks with the issued JWT.
+    """
+    # Register a user
+    registration_response = api_client.post('/auth/users/', NEW_USER, format='json')
     assert registration_response.status_code == status.HTTP_201_CREATED
 
     # Login with the user
-    login_data = {'username': 'testuser', 'password': 'password123!@#'}
+    login_data = {'username': NEW_USER['username'], 'password': NEW_USER['password']}
     login_response = api_client.post('/auth/jwt/create/', login_data, format='json')
+    assert login_response.status_code == status.HTTP_200_OK
 
     access_token = login_response.data['access']
     assert access_token is not None, "No access token returned"
@@ -55,211 +113,61 @@ def test_create_task(api_client):
     api_client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
 
     # Create a task
-    task_data = {
-        'title': 'Test Task',
-        'description': 'This is a test task',
-        'status': 'New'
-    }
-
-    task_create_response = api_client.post('/api/tasks/', task_data, format='json')
-    print(task_create_response.data)
-    # Access a protected view (e.g., user details)
+    task_create_response = api_client.post('/api/tasks/', TASK_NEW, format='json')
     assert task_create_response.status_code == status.HTTP_201_CREATED
-    assert task_create_response.data['title'] == 'Test Task'
-    assert task_create_response.data['description'] == 'This is a test task'
-    assert task_create_response.data['status'] == 'New'
+    assert task_create_response.data['user'] == registration_response.data['id']
 
 
-@pytest.mark.django_db
-def test_list_user_tasks(api_client):
+def test_list_user_tasks(api_factory, user1, user2):
     """
     Test listing tasks for each user. One user should have a task, and the other should have none.
     """
-    # Create two users
-    url = '/auth/users/'
-    user1_data = {
-        'username': 'testuser1',
-        'first_name': 'John',
-        'last_name': 'Doe',
-        'password': 'password123!@#',
-        'email': 'testuser1@example.com',
-    }
-    user2_data = {
-        'username': 'testuser2',
-        'first_name': 'Jane',
-        'last_name': 'Smith',
-        'password': 'password123!@#',
-        'email': 'testuser2@example.com',
-    }
-
-    # Register user1
-    registration_response1 = api_client.post(url, user1_data, format='json')
-    assert registration_response1.status_code == status.HTTP_201_CREATED
-
-    # Register user2
-    registration_response2 = api_client.post(url, user2_data, format='json')
-    assert registration_response2.status_code == status.HTTP_201_CREATED
-
-    # Login as user1
-    login_data1 = {'username': 'testuser1', 'password': 'password123!@#'}
-    login_response1 = api_client.post('/auth/jwt/create/', login_data1, format='json')
-    access_token1 = login_response1.data['access']
-    assert access_token1 is not None, "No access token returned for user1"
-
-    # Set the Authorization header with the token for user1
-    api_client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token1}')
-
     # Create a task assigned to user1
-    task_data = {
-        'title': 'Test Task',
-        'description': 'This is a test task',
-        'status': 'New'
-    }
-    task_create_response = api_client.post('/api/tasks/', task_data, format='json')
-    assert task_create_response.status_code == status.HTTP_201_CREATED
-    assert task_create_response.data['title'] == 'Test Task'
-    assert task_create_response.data['description'] == 'This is a test task'
-    assert task_create_response.data['status'] == 'New'
+    Task.objects.create(user=user1, title='Test Task', description='This is a test task')
 
     # List tasks for user1
-    tasks_response1 = api_client.get('/api/tasks/', format='json')
+    request = api_factory.get('/api/tasks/')
+    force_authenticate(request, user=user1)
+    tasks_response1 = task_list_view(request)
     assert tasks_response1.status_code == status.HTTP_200_OK
     assert len(tasks_response1.data['results']) == 1, "User1 should have one task"
     assert tasks_response1.data['results'][0]['title'] == 'Test Task'
 
-    # Reset credentials
-    api_client.credentials()
-
-    # Login as user2
-    login_data2 = {'username': 'testuser2', 'password': 'password123!@#'}
-    login_response2 = api_client.post('/auth/jwt/create/', login_data2, format='json')
-    access_token2 = login_response2.data['access']
-    assert access_token2 is not None, "No access token returned for user2"
-
-    # Set the Authorization header with the token for user2
-    api_client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token2}')
-
     # List tasks for user2
-    tasks_response2 = api_client.get('/api/tasks/', format='json')
+    request = api_factory.get('/api/tasks/')
+    force_authenticate(request, user=user2)
+    tasks_response2 = task_list_view(request)
     assert tasks_response2.status_code == status.HTTP_200_OK
     assert len(tasks_response2.data['results']) == 0, "User2 should have no tasks"
 
 
-def test_admin_can_list_all_tasks(api_client, django_user_model):
+def test_admin_can_list_all_tasks(api_factory, user1, admin):
     """
     Test that admin user can list all tasks.
     """
-    # Create a regular user
-    url = '/auth/users/'
-    user1_data = {
-        'username': 'testuser1',
-        'first_name': 'John',
-        'last_name': 'Doe',
-        'password': 'password123!@#',
-        'email': 'testuser1@example.com',
-    }
-
-    # Register user1
-    registration_response1 = api_client.post(url, user1_data, format='json')
-    assert registration_response1.status_code == status.HTTP_201_CREATED
-
-    # Login as user1
-    login_data1 = {'username': 'testuser1', 'password': 'password123!@#'}
-    login_response1 = api_client.post('/auth/jwt/create/', login_data1, format='json')
-    assert login_response1.status_code == status.HTTP_200_OK, "User1 login failed"
-    access_token1 = login_response1.data['access']
-    assert access_token1 is not None, "No access token returned for user1"
-
-    # Set the Authorization header with the token for user1
-    api_client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token1}')
-
     # Create a task assigned to user1
-    task_data = {
-        'title': 'Test Task',
-        'description': 'This is a test task',
-        'status': 'New'
-    }
-    task_create_response = api_client.post('/api/tasks/', task_data, format='json')
-    assert task_create_response.status_code == status.HTTP_201_CREATED
-    assert task_create_response.data['title'] == 'Test Task'
-    assert task_create_response.data['description'] == 'This is a test task'
-    assert task_create_response.data['status'] == 'New'
-
-    # Reset credentials
-    api_client.credentials()
-
-    # Create admin user (if not already created)
-    admin_username = 'admin'
-    admin_password = 'Admin123@'
-
-    # Check if admin user exists; if not, create one
-    if not django_user_model.objects.filter(username=admin_username).exists():
-        django_user_model.objects.create_superuser(
-            username=admin_username,
-            email='admin@example.com',
-            password=admin_password
-        )
-
-    # Login as admin
-    login_data_admin = {'username': admin_username, 'password': admin_password}
-    login_response_admin = api_client.post('/auth/jwt/create/', login_data_admin, format='json')
-    assert login_response_admin.status_code == status.HTTP_200_OK, "Admin login failed"
-    access_token_admin = login_response_admin.data['access']
-    assert access_token_admin is not None, "No access token returned for admin"
-
-    # Set the Authorization header with the token for admin
-    api_client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token_admin}')
+    Task.objects.create(user=user1, title='Test Task', description='This is a test task')
 
     # List tasks as admin
-    tasks_response_admin = api_client.get('/api/tasks/', format='json')
+    request = api_factory.get('/api/tasks/')
+    force_authenticate(request, user=admin)
+    tasks_response_admin = task_list_view(request)
     assert tasks_response_admin.status_code == status.HTTP_200_OK, "Admin failed to retrieve tasks"
     # Verify that admin can see the task created by user1
     assert len(tasks_response_admin.data['results']) == 1, "Admin should see all tasks"
     assert tasks_response_admin.data['results'][0]['title'] == 'Test Task'
 
 
-@pytest.mark.django_db
-def test_get_specific_task(api_client):
+def test_get_specific_task(api_client, login_as, user1):
     """
     Test getting information about a specific task.
     """
-    # Create a user and get tokens
-    url = '/auth/users/'
-    data = {
-        'username': 'testuser',
-        'first_name': 'John',
-        'last_name': 'Dillinger',
-        'password': 'password123!@#',
-        'email': 'testuser@example.com',
-    }
-
-    registration_response = api_client.post(url, data, format='json')
-    assert registration_response.status_code == status.HTTP_201_CREATED, "User registration failed"
-
-    # Login with the user
-    login_data = {'username': 'testuser', 'password': 'password123!@#'}
-    login_response = api_client.post('/auth/jwt/create/', login_data, format='json')
-    assert login_response.status_code == status.HTTP_200_OK, "User login failed"
-
-    access_token = login_response.data.get('access')
-    assert access_token is not None, "No access token returned"
-
-    # Set the Authorization header with the token
-    api_client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+    # Authenticate as user1
+    login_as(user1)
 
     # Create a task
-    task_data = {
-        'title': 'Test Task',
-        'description': 'This is a test task',
-        'status': 'New'
-    }
-
-    task_create_response = api_client.post('/api/tasks/', task_data, format='json')
-    assert task_create_response.status_code == status.HTTP_201_CREATED, "Task creation failed"
-    assert task_create_response.data['title'] == 'Test Task', "Task title mismatch"
-    assert (task_create_response.data['description'] == 'This is a test task'
-    ),"Task description mismatch"
-    assert task_create_response.data['status'] == 'New', "Task status mismatch"
+    task_create_response = api_client.post('/api/tasks/', TASK_NEW, format='json')
+    assert_task_matches(task_create_response, status.HTTP_201_CREATED, **TASK_NEW)
 
     # Get the ID of the created task
     task_id = task_create_response.data['id']
@@ -267,163 +175,55 @@ def test_get_specific_task(api_client):
     # Retrieve the specific task
     task_detail_url = f'/api/tasks/{task_id}/'
     task_detail_response = api_client.get(task_detail_url, format='json')
-    assert (task_detail_response.status_code == status.HTTP_200_OK
-    ), f"Failed to retrieve task {task_id}"
-    assert task_detail_response.data['id'] == task_id, "Task ID mismatch"
-    assert task_detail_response.data['title'] == 'Test Task', "Task title mismatch"
-    assert (task_detail_response.data['description'] == 'This is a test task'
-    ), "Task description mismatch"
-    assert task_detail_response.data['status'] == 'New', "Task status mismatch"
+    assert_task_matches(task_detail_response, status.HTTP_200_OK, id=task_id, **TASK_NEW)
 
 
-@pytest.mark.django_db
-def test_owner_can_update_task(api_client):
+def test_owner_can_update_task(api_client, login_as, user1):
     """
     Test that the task owner can fully update task information.
     """
-    # Create a user and get tokens
-    url = '/auth/users/'
-    data = {
-        'username': 'testuser',
-        'first_name': 'John',
-        'last_name': 'Dillinger',
-        'password': 'password123!@#',
-        'email': 'testuser@example.com',
-    }
-
-    registration_response = api_client.post(url, data, format='json')
-    assert registration_response.status_code == status.HTTP_201_CREATED, "User registration failed"
-
-    # Login with the user
-    login_data = {'username': 'testuser', 'password': 'password123!@#'}
-    login_response = api_client.post('/auth/jwt/create/', login_data, format='json')
-    assert login_response.status_code == status.HTTP_200_OK, "User login failed"
-
-    access_token = login_response.data.get('access')
-    assert access_token is not None, "No access token returned"
-
-    # Set the Authorization header with the token
-    api_client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+    # Authenticate as user1
+    login_as(user1)
 
     # Create a task
-    task_data = {
-        'title': 'Test Task',
-        'description': 'This is a test task',
-        'status': 'New'
-    }
-
-    task_create_response = api_client.post('/api/tasks/', task_data, format='json')
-    assert task_create_response.status_code == status.HTTP_201_CREATED, "Task creation failed"
-    assert task_create_response.data['title'] == 'Test Task'
-    assert task_create_response.data['description'] == 'This is a test task'
-    assert task_create_response.data['status'] == 'New'
+    task_create_response = api_client.post('/api/tasks/', TASK_NEW, format='json')
+    assert_task_matches(task_create_response, status.HTTP_201_CREATED, **TASK_NEW)
 
     # Get the ID of the created task
     task_id = task_create_response.data['id']
 
     # Update the task
-    updated_task_data = {
-        'title': 'Updated Task',
-        'description': 'This is an updated test task',
-        'status': 'In Progress'
-    }
-
     task_update_response = api_client.put(
         f'/api/tasks/{task_id}/',
-        updated_task_data,
+        TASK_UPDATED,
         format='json'
     )
-    assert task_update_response.status_code == status.HTTP_200_OK, "Task update failed"
-    assert task_update_response.data['title'] == 'Updated Task'
-    assert task_update_response.data['description'] == 'This is an updated test task'
-    assert task_update_response.data['status'] == 'In Progress'
+    assert_task_matches(task_update_response, status.HTTP_200_OK, **TASK_UPDATED)
 
     # Verify that the task was updated
     task_detail_response = api_client.get(f'/api/tasks/{task_id}/', format='json')
-    assert task_detail_response.status_code == status.HTTP_200_OK, "Failed to retrieve task"
-    assert task_detail_response.data['title'] == 'Updated Task'
-    assert task_detail_response.data['description'] == 'This is an updated test task'
-    assert task_detail_response.data['status'] == 'In Progress'
+    assert_task_matches(task_detail_response, status.HTTP_200_OK, **TASK_UPDATED)
 
 
-@pytest.mark.django_db
-def test_user_cannot_update_unowned_task(api_client):
+def test_user_cannot_update_unowned_task(api_client, login_as, user1, user2):
     """
     Test that a user cannot update a task they do not own.
     """
-    # Create user1 and get tokens
-    url = '/auth/users/'
-    user1_data = {
-        'username': 'user1',
-        'first_name': 'John',
-        'last_name': 'Doe',
-        'password': 'password123!@#',
-        'email': 'user1@example.com',
-    }
-
-    registration_response1 = api_client.post(url, user1_data, format='json')
-    assert (registration_response1.status_code == status.HTTP_201_CREATED
-    ), "User1 registration failed"
-
-    # Login with user1
-    login_data1 = {'username': 'user1', 'password': 'password123!@#'}
-    login_response1 = api_client.post('/auth/jwt/create/', login_data1, format='json')
-    assert login_response1.status_code == status.HTTP_200_OK, "User1 login failed"
-
-    access_token1 = login_response1.data.get('access')
-    assert access_token1 is not None, "No access token returned for user1"
-
-    # Set the Authorization header with the token for user1
-    api_client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token1}')
+    # Authenticate as user1
+    login_as(user1)
 
     # Create a task as user1
-    task_data = {
-        'title': 'User1 Task',
-        'description': 'Task created by user1',
-        'status': 'New'
-    }
-
-    task_create_response = api_client.post('/api/tasks/', task_data, format='json')
+    task_create_response = api_client.post('/api/tasks/', USER1_TASK, format='json')
     assert task_create_response.status_code == status.HTTP_201_CREATED, "Task creation failed"
     task_id = task_create_response.data['id']
 
-    # Reset credentials
-    api_client.credentials()
-
-    # Create user2
-    user2_data = {
-        'username': 'user2',
-        'first_name': 'Jane',
-        'last_name': 'Smith',
-        'password': 'password123!@#',
-        'email': 'user2@example.com',
-    }
-
-    registration_response2 = api_client.post(url, user2_data, format='json')
-    assert (registration_response2.status_code == status.HTTP_201_CREATED
-    ), "User2 registration failed"
-
-    # Login with user2
-    login_data2 = {'username': 'user2', 'password': 'password123!@#'}
-    login_response2 = api_client.post('/auth/jwt/create/', login_data2, format='json')
-    assert login_response2.status_code == status.HTTP_200_OK, "User2 login failed"
-
-    access_token2 = login_response2.data.get('access')
-    assert access_token2 is not None, "No access token returned for user2"
-
-    # Set the Authorization header with the token for user2
-    api_client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token2}')
+    # Authenticate as user2
+    login_as(user2)
 
     # Attempt to update user1's task as user2
-    updated_task_data = {
-        'title': 'Updated Task by User2',
-        'description': 'User2 attempting to update task',
-        'status': 'In Progress'
-    }
-
     task_update_response = api_client.put(
         f'/api/tasks/{task_id}/',
-        updated_task_data,
+        TASK_UPDATED,
         format='json'
     )
 
@@ -432,44 +232,15 @@ def test_user_cannot_update_unowned_task(api_client):
             ), "User2 should not be able to update user1's task"
 
 
-@pytest.mark.django_db
-def test_delete_task_only_by_owner(api_client):
+def test_delete_task_only_by_owner(api_client, login_as, user1, user2):
     """
     Test that a task can be deleted only by its owner.
     """
-    # Create user1 and get tokens
-    url = '/auth/users/'
-    user1_data = {
-        'username': 'user1',
-        'first_name': 'John',
-        'last_name': 'Doe',
-        'password': 'password123!@#',
-        'email': 'user1@example.com',
-    }
-
-    registration_response1 = api_client.post(url, user1_data, format='json')
-    assert (registration_response1.status_code == status.HTTP_201_CREATED
-    ), "User1 registration failed"
-
-    # Login with user1
-    login_data1 = {'username': 'user1', 'password': 'password123!@#'}
-    login_response1 = api_client.post('/auth/jwt/create/', login_data1, format='json')
-    assert login_response1.status_code == status.HTTP_200_OK, "User1 login failed"
-
-    access_token1 = login_response1.data.get('access')
-    assert access_token1 is not None, "No access token returned for user1"
-
-    # Set the Authorization header with the token for user1
-    api_client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token1}')
+    # Authenticate as user1
+    login_as(user1)
 
     # Create a task as user1
-    task_data = {
-        'title': 'User1 Task',
-        'description': 'Task created by user1',
-        'status': 'New'
-    }
-
-    task_create_response = api_client.post('/api/tasks/', task_data, format='json')
+    task_create_response = api_client.post('/api/tasks/', USER1_TASK, format='json')
     assert task_create_response.status_code == status.HTTP_201_CREATED, "Task creation failed"
     task_id = task_create_response.data['id']
 
@@ -484,29 +255,8 @@ def test_delete_task_only_by_owner(api_client):
     assert (task_get_response.status_code == status.HTTP_404_NOT_FOUND
     ), "Deleted task should not be retrievable"
 
-    # Create user2 and get tokens
-    user2_data = {
-        'username': 'user2',
-        'first_name': 'Jane',
-        'last_name': 'Smith',
-        'password': 'password123!@#',
-        'email': 'user2@example.com',
-    }
-
-    registration_response2 = api_client.post(url, user2_data, format='json')
-    assert (registration_response2.status_code == status.HTTP_201_CREATED
-    ), "User2 registration failed"
-
-    # Login with user2
-    login_data2 = {'username': 'user2', 'password': 'password123!@#'}
-    login_response2 = api_client.post('/auth/jwt/create/', login_data2, format='json')
-    assert login_response2.status_code == status.HTTP_200_OK, "User2 login failed"
-
-    access_token2 = login_response2.data.get('access')
-    assert access_token2 is not None, "No access token returned for user2"
-
-    # Set the Authorization header with the token for user2
-    api_client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token2}')
+    # Authenticate as user2
+    login_as(user2)
 
     # Attempt to delete the task as user2 (should fail)
     task_delete_response = api_client.delete(task_delete_url)
@@ -515,103 +265,40 @@ def test_delete_task_only_by_owner(api_client):
     ), ("User2 should not be able to delete user1's task")
 
 
-@pytest.mark.django_db
-def test_mark_task_as_completed(api_client):
+def test_mark_task_as_completed(api_client, login_as, user1, user2):
     """
     Test that the task owner can mark a task as completed.
     """
-    # Create a user and get tokens
-    url = '/auth/users/'
-    data = {
-        'username': 'testuser',
-        'first_name': 'John',
-        'last_name': 'Dillinger',
-        'password': 'password123!@#',
-        'email': 'testuser@example.com',
-    }
-
-    registration_response = api_client.post(url, data, format='json')
-    assert registration_response.status_code == status.HTTP_201_CREATED, "User registration failed"
-
-    # Login with the user
-    login_data = {'username': 'testuser', 'password': 'password123!@#'}
-    login_response = api_client.post('/auth/jwt/create/', login_data, format='json')
-    assert login_response.status_code == status.HTTP_200_OK, "User login failed"
-
-    access_token = login_response.data.get('access')
-    assert access_token is not None, "No access token returned"
-
-    # Set the Authorization header with the token
-    api_client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+    # Authenticate as user1
+    login_as(user1)
 
     # Create a task with status 'New'
-    task_data = {
-        'title': 'Test Task',
-        'description': 'This is a test task',
-        'status': 'New'
-    }
-
-    task_create_response = api_client.post('/api/tasks/', task_data, format='json')
-    assert task_create_response.status_code == status.HTTP_201_CREATED, "Task creation failed"
-    assert task_create_response.data['title'] == 'Test Task'
-    assert task_create_response.data['description'] == 'This is a test task'
-    assert task_create_response.data['status'] == 'New'
+    task_create_response = api_client.post('/api/tasks/', TASK_NEW, format='json')
+    assert_task_matches(task_create_response, status.HTTP_201_CREATED, **TASK_NEW)
 
     # Get the ID of the created task
     task_id = task_create_response.data['id']
 
     # Update the task's status to 'Completed'
-    updated_task_data = {
-        'status': 'Completed'
-    }
-
     task_update_response = api_client.patch(
         f'/api/tasks/{task_id}/',
-        updated_task_data,
+        TASK_COMPLETED,
         format='json'
     )
-    assert task_update_response.status_code == status.HTTP_200_OK, "Task status update failed"
-    assert (task_update_response.data['status'] == 'Completed'
-    ), "Task status was not updated to 'Completed'"
+    assert_task_matches(task_update_response, status.HTTP_200_OK, status='Completed')
 
     # Verify that the task's status was updated
     task_detail_response = api_client.get(f'/api/tasks/{task_id}/', format='json')
-    assert task_detail_response.status_code == status.HTTP_200_OK, "Failed to retrieve task"
-    assert task_detail_response.data['status'] == 'Completed', "Task status mismatch after update"
+    assert_task_matches(task_detail_response, status.HTTP_200_OK, status='Completed')
 
     # Optionally, attempt to mark the task as completed by another user (should fail)
-    # Create another user
-    user2_data = {
-        'username': 'user2',
-        'first_name': 'Jane',
-        'last_name': 'Smith',
-        'password': 'password123!@#',
-        'email': 'user2@example.com',
-    }
-
-    registration_response2 = api_client.post(url, user2_data, format='json')
-    assert (registration_response2.status_code == status.HTTP_201_CREATED
-    ), "User2 registration failed"
-
-    # Login with user2
-    login_data2 = {'username': 'user2', 'password': 'password123!@#'}
-    login_response2 = api_client.post('/auth/jwt/create/', login_data2, format='json')
-    assert login_response2.status_code == status.HTTP_200_OK, "User2 login failed"
-
-    access_token2 = login_response2.data.get('access')
-    assert access_token2 is not None, "No access token returned for user2"
-
-    # Set the Authorization header with the token for user2
-    api_client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token2}')
+    # Authenticate as user2
+    login_as(user2)
 
     # Attempt to update the task's status as user2
-    updated_task_data_user2 = {
-        'status': 'Completed'
-    }
-
     task_update_response_user2 = api_client.patch(
         f'/api/tasks/{task_id}/',
-        updated_task_data_user2,
+        TASK_COMPLETED,
         format='json'
     )
 
@@ -622,92 +309,217 @@ def test_mark_task_as_completed(api_client):
     )
 
 
-@pytest.mark.django_db
-def test_filter_tasks_by_status(api_client):
+@pytest.fixture
+def two_tasks(user1):
+    """
+    Creates two tasks for `user1`, one 'New' and one 'Completed', directly through the ORM.
+    """
+    return Task.objects.bulk_create([
+        Task(
+            user=user1,
+            title='Task New',
+            description='This is a new task',
+            status=Task.Status.NEW
+        ),
+        Task(
+            user=user1,
+            title='Task Completed',
+            description='This is a completed task',
+            status=Task.Status.COMPLETED
+        ),
+    ])
+
+
+@pytest.mark.parametrize('filter_status, expected_count, expected_title', [
+    ('New', 1, 'Task New'),
+    ('Completed', 1, 'Task Completed'),
+    # A status that has no tasks
+    ('In Progress', 0, None),
+])
+@pytest.mark.usefixtures('two_tasks')
+def test_filter_tasks_by_status(api_factory, user1, filter_status, expected_count, expected_title):
     """
     Test filtering tasks by status with two tasks of different statuses.
     """
-    # Create a user and get tokens
-    url = '/auth/users/'
-    user_data = {
-        'username': 'testuser',
-        'first_name': 'John',
-        'last_name': 'Doe',
-        'password': 'password123!@#',
-        'email': 'testuser@example.com',
-    }
+    request = api_factory.get('/api/tasks/', {'status': filter_status})
+    force_authenticate(request, user=user1)
+    task_list_response = task_list_view(request)
+    assert (task_list_response.status_code == status.HTTP_200_OK
+    ), f"Failed to retrieve tasks with status '{filter_status}'"
+
+    tasks = task_list_response.data['results']
+    assert (len(tasks) == expected_count
+    ), f"Expected {expected_count} tasks with status '{filter_status}', got {len(tasks)}"
+    for task in tasks:
+        assert (task['status'] == filter_status
+        ), f"Task status mismatch: expected '{filter_status}', got {task['status']}"
+        assert (task['title'] == expected_title
+        ), f"Task title mismatch for status '{filter_status}'"
+
+
+def test_filter_tasks_by_unknown_status(api_factory, user1):
+    """
+    Test that filtering by a status outside the allowed labels is rejected.
+    """
+    request = api_factory.get('/api/tasks/', {'status': 'Archived'})
+    force_authenticate(request, user=user1)
+    task_list_response = task_list_view(request)
+    assert (task_list_response.status_code == status.HTTP_400_BAD_REQUEST
+    ), "Filtering by an unknown status should be rejected"
+    assert 'status' in task_list_response.data
 
-    registration_response = api_client.post(url, user_data, format='json')
-    assert registration_response.status_code == status.HTTP_201_CREATED, "User registration failed"
 
-    # Login with the user
-    login_data = {'username': 'testuser', 'password': 'password123!@#'}
-    login_response = api_client.post('/auth/jwt/create/', login_data, format='json')
-    assert login_response.status_code == status.HTTP_200_OK, "User login failed"
+def test_list_tasks_query_count_is_constant(api_factory, user1, django_assert_max_num_queries):
+    """
+    Test that listing tasks does not issue an extra query per task to resolve its owner.
+    """
+    for index in range(5):
+        Task.objects.create(user=user1, title=f'Task {index}', status=Task.Status.NEW)
 
-    access_token = login_response.data.get('access')
-    assert access_token is not None, "No access token returned"
+    request = api_factory.get('/api/tasks/')
+    force_authenticate(request, user=user1)
 
-    # Set the Authorization header with the token
-    api_client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+    # A single query for the page itself, regardless of the task count
+    with django_assert_max_num_queries(1):
+        task_list_response = task_list_view(request)
 
-    # Create the first task with status 'New'
-    task_data_new = {
-        'title': 'Task New',
-        'description': 'This is a new task',
-        'status': 'New'
-    }
-    task_create_response_new = api_client.post('/api/tasks/', task_data_new, format='json')
-    assert (task_create_response_new.status_code == status.HTTP_201_CREATED
-    ), "Task creation failed for status 'New'"
-
-    # Create the second task with status 'Completed'
-    task_data_completed = {
-        'title': 'Task Completed',
-        'description': 'This is a completed task',
-        'status': 'Completed'
-    }
-    task_create_response_completed = api_client.post(
+    assert task_list_response.status_code == status.HTTP_200_OK, "Failed to retrieve tasks"
+    assert len(task_list_response.data['results']) == 5, "Expected all five tasks to be listed"
+    assert task_list_response.data['results'][0]['user'] == user1.pk, "Task owner mismatch"
+
+
+def test_list_tasks_is_paginated_by_cursor(api_factory, user1):
+    """
+    Test that the task list is split into pages linked by cursors, in title order.
+    """
+    Task.objects.bulk_create([
+        Task(user=user1, title=title) for title in ('Task C', 'Task A', 'Task B')
+    ])
+
+    titles = []
+    query_params = {'page_size': 2}
+    while query_params is not None:
+        request = api_factory.get('/api/tasks/', query_params)
+        force_authenticate(request, user=user1)
+        task_list_response = task_list_view(request)
+        assert task_list_response.status_code == status.HTTP_200_OK, "Failed to retrieve tasks"
+        assert 'count' not in task_list_response.data, "Cursor pages should not count the tasks"
+
+        titles.extend(task['title'] for task in task_list_response.data['results'])
+        next_url = task_list_response.data['next']
+        query_params = parse_qs(urlsplit(next_url).query) if next_url else None
+
+    assert titles == ['Task A', 'Task B', 'Task C'], "Tasks should be listed once each, by title"
+
+
+def test_create_task_with_invalid_status(api_factory, user1):
+    """
+    Test that a task cannot be created with a status outside the allowed labels.
+    """
+    request = api_factory.post(
         '/api/tasks/',
-        task_data_completed,
+        {**TASK_NEW, 'status': 'Archived'},
         format='json'
     )
-    assert (task_create_response_completed.status_code == status.HTTP_201_CREATED
-    ), "Task creation failed for status 'Completed'"
-
-    # Filter tasks by status 'New'
-    filter_status = 'New'
-    task_list_response_new = api_client.get(f'/api/tasks/?status={filter_status}', format='json')
-    assert (task_list_response_new.status_code == status.HTTP_200_OK
-    ), "Failed to retrieve tasks with status 'New'"
-
-    tasks_new = task_list_response_new.data['results']
-    assert len(tasks_new) == 1, f"Expected 1 task with status 'New', got {len(tasks_new)}"
-    assert (tasks_new[0]['status'] == 'New'
-    ), f"Task status mismatch: expected 'New', got {tasks_new[0]['status']}"
-    assert tasks_new[0]['title'] == 'Task New', "Task title mismatch for status 'New'"
-
-    # Filter tasks by status 'Completed'
-    filter_status = 'Completed'
-    task_list_response_completed = api_client.get(
-        f'/api/tasks/?status={filter_status}',
-        format='json'
+    force_authenticate(request, user=user1)
+    task_create_response = task_list_view(request)
+    assert (task_create_response.status_code == status.HTTP_400_BAD_REQUEST
+    ), "Task with an unknown status should be rejected"
+    assert 'status' in task_create_response.data
+    assert not Task.objects.exists(), "No task should have been created"
+
+
+def test_task_responses_are_rendered_as_json(api_client, login_as, user1):
+    """
+    Test that task responses, including validation errors, are rendered as JSON.
+    """
+    login_as(user1)
+
+    task_data = {**TASK_NEW, 'description': 'Описание задачи'}
+    task_create_response = api_client.post('/api/tasks/', task_data, format='json')
+    assert task_create_response.status_code == status.HTTP_201_CREATED, "Task creation failed"
+    assert task_create_response['Content-Type'] == 'application/json'
+    assert task_create_response.json() == {
+        'id': task_create_response.data['id'],
+        'title': 'Test Task',
+        'description': 'Описание задачи',
+        'status': 'New',
+        'user': user1.pk,
+    }
+
+    invalid_response = api_client.post('/api/tasks/', {'status': 'New'}, format='json')
+    assert invalid_response.status_code == status.HTTP_400_BAD_REQUEST
+    assert invalid_response.json() == {'title': ['This field is required.']}
+
+
+def test_create_task_with_malformed_json(api_client, login_as, user1):
+    """
+    Test that a request body that is not valid JSON is rejected with a parse error.
+    """
+    login_as(user1)
+
+    task_create_response = api_client.post(
+        '/api/tasks/',
+        b'{"title": "Test Task",',
+        content_type='application/json'
+    )
+    assert task_create_response.status_code == status.HTTP_400_BAD_REQUEST
+    assert task_create_response.json()['detail'].startswith('JSON parse error')
+    assert not Task.objects.exists(), "No task should have been created"
+
+
+@pytest.mark.parametrize('data', [
+    # Errors of list and dict fields are keyed by integer indexes
+    {'tags': {0: ['Not a valid string.']}},
+    {'created': datetime(2024, 1, 2, 3, 4, 5, 600000, tzinfo=timezone.utc)},
+    {'description': 'Line\u2028Paragraph\u2029End'},
+    {'id': 2 ** 70},
+], ids=['int-keys', 'datetime', 'line-separators', 'wide-int'])
+def test_orjson_renderer_matches_default_renderer(data):
+    """
+    Test that the orjson renderer produces the same JSON as DRF's default renderer.
+    """
+    assert ORJSONRenderer().render(data) == JSONRenderer().render(data)
+
+
+class PublicActionTasksViewSet(TasksViewSet):  # pylint: disable=R0901
+    """Tasks viewset with an extra action that anyone may call."""
+
+    @action(detail=False, permission_classes=[AllowAny])
+    def ping(self, request):
+        """Respond to anonymous and authenticated users alike."""
+        return Response({'ping': 'pong'})
+
+
+def test_action_permission_classes_are_honoured(api_factory):
+    """
+    Test that permission classes set on an action replace the viewset's own.
+    """
+    # Routers pass the action's own settings, including its permission classes, this way
+    ping_view = PublicActionTasksViewSet.as_view(
+        {'get': 'ping'},
+        **PublicActionTasksViewSet.ping.kwargs  # pylint: disable=E1101
     )
-    assert (task_list_response_completed.status_code == status.HTTP_200_OK
-    ), "Failed to retrieve tasks with status 'Completed'"
-
-    tasks_completed = task_list_response_completed.data['results']
-    assert (len(tasks_completed) == 1
-    ), f"Expected 1 task with status 'Completed', got {len(tasks_completed)}"
-    assert (tasks_completed[0]['status'] == 'Completed'
-    ), f"Task status mismatch: expected 'Completed', got {tasks_completed[0]['status']}"
-    assert (tasks_completed[0]['title'] == 'Task Completed'
-    ), "Task title mismatch for status 'Completed'"
-
-    # Optionally, test filtering with a status that has no tasks
-    filter_status = 'In Progress'
-    task_list_response_none = api_client.get(f'/api/tasks/?status={filter_status}', format='json')
-    assert task_list_response_none.status_code == status.HTTP_200_OK, "Failed to retrieve tasks"
-    tasks_none = task_list_response_none.data['results']
-    assert (len(tasks_none) == 0
-    ), f"Expected 0 tasks with status '{filter_status}', got {len(tasks_none)}"
+
+    # The anonymous request only passes AllowAny; the shared IsAuthenticated would reject it
+    ping_response = ping_view(api_factory.get('/api/tasks/ping/'))
+    assert ping_response.status_code == status.HTTP_200_OK
+    assert ping_response.data == {'ping': 'pong'}
+
+
+@pytest.mark.parametrize('body, expected', [
+    (b'{"id": 42, "ratio": 0.5, "title": "Task"}', {'id': 42, 'ratio': 0.5, 'title': 'Task'}),
+    # Integers wider than 64 bits must not be rounded to floats
+    (b'{"id": 123456789012345678901234567890}', {'id': 123456789012345678901234567890}),
+    (b'{"id": -18446744073709551616}', {'id': -18446744073709551616}),
+    # Just below -2**63, yet only 19 digits long
+    (b'{"id": -9223372036854775809}', {'id': -9223372036854775809}),
+], ids=['regular', 'wide-int', 'wide-negative-int', 'int-below-int64'])
+def test_orjson_parser_matches_default_parser(body, expected):
+    """
+    Test that the orjson parser decodes request bodies exactly like DRF's default parser.
+    """
+    parsed = ORJSONParser().parse(io.BytesIO(body))
+    assert parsed == expected
+    assert parsed == JSONParser().parse(io.BytesIO(body))
+    assert all(type(parsed[key]) is type(value) for key, value in expected.items())
@@ -12,7 +12,6 @@ from .views import TasksViewSet
 router = DefaultRouter()
 router.register(r'tasks', TasksViewSet, basename='task')
 
-urlpatterns = router.urls
 urlpatterns = [
     path('', include(router.urls)),
 ]
@@ -5,12 +5,16 @@ This module contains views related to task management in the To-Do List applicat
 The views are built using Django REST Framework (DRF).
 The views are intended to handle HTTP requests and provide appropriate responses.
 """
-from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import viewsets, permissions
+from rest_framework.exceptions import ValidationError
 from .models import Task
+from .pagination import TaskCursorPagination
 from .permissions import IsOwnerOrReadOnly
 from .serializers import TasksSerializer
 
+# Columns the serializer renders; the queryset loads only these
+_LIST_FIELDS = tuple(TasksSerializer.Meta.fields)
+
 class TasksViewSet(viewsets.ModelViewSet):
     """
     ViewSet for managing tasks.
@@ -18,18 +22,44 @@ class TasksViewSet(viewsets.ModelViewSet):
     Provides CRUD operations for tasks, allowing:
         - Admin users to access all tasks.
         - Regular users to access, create, update, and delete their own tasks.
+
+    Tasks can be filtered by status label with the `status` query parameter,
+    e.g. `?status=Completed`.
     """
     serializer_class = TasksSerializer
     permission_classes = [permissions.IsAuthenticated, IsOwnerOrReadOnly]
-    filter_backends = [DjangoFilterBackend]
-    filterset_fields = ['status']
+    # The permissions keep no per-request state, so one set of instances serves every request
+    _permissions = tuple(permission() for permission in permission_classes)
+    # Status filtering is done in get_queryset, so none of the default backends apply
+    filter_backends = []
+    pagination_class = TaskCursorPagination
+
+    def get_permissions(self):
+        """
+        Return the shared permission instances instead of instantiating them per request.
+
+        Permission classes overridden on the instance, as `@action(permission_classes=...)`
+        and `as_view(permission_classes=...)` do, are instantiated as usual.
+        """
+        if self.permission_classes is TasksViewSet.permission_classes:
+            return self._permissions
+        return super().get_permissions()
 
     def get_queryset(self):
         """
         If the user is an admin, return all tasks.
         Otherwise, return only the tasks assigned to the authenticated user.
+        Either way, narrow the tasks down to the requested `status`, if any.
         """
-        if self.request.user.is_staff:
-            return Task.objects.all().order_by('title')
+        queryset = Task.objects.only(*_LIST_FIELDS).order_by('title', 'id')
         # Non-admin users can only see their own tasks
-        return Task.objects.filter(user=self.request.user).order_by('title')
+        if not self.request.user.is_staff:
+            queryset = queryset.filter(user=self.request.user)
+
+        status = self.request.query_params.get('status')
+        if status:
+            try:
+                queryset = queryset.filter(status=Task.Status.from_label(status))
+            except ValueError as exc:
+                raise ValidationError({'status': [str(exc)]}) from exc
+        return queryset
@@ -0,0 +1,31 @@
+# pylint: disable=W0401,W0614
+"""
+Django settings used when running the test suite.
+
+Extends the project settings with overrides that only make sense under test,
+such as an in-memory database and a fast password hasher. See `pytest.ini` for
+where this module is selected.
+"""
+from .settings import *
+
+# Tests run against an in-memory SQLite database, so they need no PostgreSQL server
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': ':memory:',
+    }
+}
+
+# The default PBKDF2 hasher is deliberately slow; tests never need that protection
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.MD5PasswordHasher',
+]
+
+# The test client encodes `format='json'` request bodies with orjson as well
+REST_FRAMEWORK = {
+    **REST_FRAMEWORK,
+    'TEST_REQUEST_RENDERER_CLASSES': [
+        'rest_framework.renderers.MultiPartRenderer',
+        'tasks_api.renderers.ORJSONRenderer',
+    ],
+}